@@ -1,26 +1,105 @@
 """Application configuration loaded from environment variables."""
 
+import json
 import os
-from dotenv import load_dotenv
+import tempfile
+from dataclasses import dataclass, field
 
-load_dotenv()
+from dotenv import dotenv_values, load_dotenv
 
+_ENV_FILE = ".env"
 
-class Config:
-    """Central configuration for the Sheets-to-S3 pipeline."""
+
+def _env_cache_file() -> str | None:
+    """Return the per-user env cache path, or None if it can't be trusted.
+
+    The cache lives in a uid-suffixed, owner-only directory under the temp
+    dir rather than a fixed shared path: a predictable world-visible file
+    would let any local user pre-seed the cache and inject credentials
+    into the pipeline's environment. If the directory exists but is not
+    ours or is group/other accessible, the cache is skipped entirely.
+    """
+    cache_dir = os.path.join(tempfile.gettempdir(), f".connect_team_env-{os.getuid()}")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        st = os.stat(cache_dir)
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            return None
+    except OSError:
+        return None
+    return os.path.join(cache_dir, "env.cache.json")
+
+
+def _load_cached_env() -> None:
+    """Load .env into the environment, caching the parsed values.
+
+    python-dotenv re-parses .env on every interpreter start; for short-lived
+    per-run invocations that parse dominates config load time. The parsed
+    values are cached as JSON (owner-only permissions, since they hold
+    credentials) keyed on the .env mtime and reused until the file changes.
+    Like load_dotenv, cached values never override variables already set in
+    the environment.
+    """
+    try:
+        mtime = os.path.getmtime(_ENV_FILE)
+    except OSError:
+        # No .env next to the process — fall back to dotenv's own discovery
+        load_dotenv()
+        return
+
+    cache_file = _env_cache_file()
+
+    if cache_file is not None:
+        try:
+            with open(cache_file) as fh:
+                cached = json.load(fh)
+            if cached.get("mtime") == mtime:
+                for key, value in cached["values"].items():
+                    os.environ.setdefault(key, value)
+                return
+        except (OSError, ValueError, KeyError):
+            pass
+
+    values = {k: v for k, v in dotenv_values(_ENV_FILE).items() if v is not None}
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+    if cache_file is not None:
+        try:
+            fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+            with os.fdopen(fd, "w") as fh:
+                json.dump({"mtime": mtime, "values": values}, fh)
+        except OSError:
+            # Cache is best-effort; the values are already in the environment
+            pass
+
+
+_load_cached_env()
+
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Central configuration for the Sheets-to-S3 pipeline.
+
+    Frozen with slots so attribute reads are fixed-offset lookups and the
+    values cannot drift after import.
+    """
 
     # Google Sheets
-    SPREADSHEET_ID = os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID", "")
-    SHEET_RANGE = os.getenv("GOOGLE_SHEETS_RANGE", "Sheet1")
-    SERVICE_ACCOUNT_FILE = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE", "service_account.json")
+    SPREADSHEET_ID: str = field(default=os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID", ""))
+    SHEET_RANGE: str = field(default=os.getenv("GOOGLE_SHEETS_RANGE", "Sheet1"))
+    SERVICE_ACCOUNT_FILE: str = field(default=os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE", "service_account.json"))
 
     # AWS S3
-    AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID", "")
-    AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY", "")
-    AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
-    S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "")
-    S3_PREFIX = os.getenv("S3_PREFIX", "hr-reports/")
+    AWS_ACCESS_KEY_ID: str = field(default=os.getenv("AWS_ACCESS_KEY_ID", ""))
+    AWS_SECRET_ACCESS_KEY: str = field(default=os.getenv("AWS_SECRET_ACCESS_KEY", ""))
+    AWS_REGION: str = field(default=os.getenv("AWS_REGION", "us-east-1"))
+    S3_BUCKET_NAME: str = field(default=os.getenv("S3_BUCKET_NAME", ""))
+    S3_PREFIX: str = field(default=os.getenv("S3_PREFIX", "hr-reports/"))
 
     # Output
-    OUTPUT_DIR = os.getenv("OUTPUT_DIR", "output")
-    OUTPUT_FILENAME_PREFIX = os.getenv("OUTPUT_FILENAME_PREFIX", "HR_Report")
+    OUTPUT_DIR: str = field(default=os.getenv("OUTPUT_DIR", "output"))
+    OUTPUT_FILENAME_PREFIX: str = field(default=os.getenv("OUTPUT_FILENAME_PREFIX", "HR_Report"))
+
+
+Config = _Config()
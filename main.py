@@ -10,13 +10,16 @@ Orchestrates the full workflow:
 import argparse
 import logging
 import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
 
 from config import Config
 from src.sheets_client import fetch_sheet_data
 from src.data_processor import process_clock_events
 from src.excel_formatter import format_excel
-from src.s3_uploader import upload_to_s3
+from src.s3_uploader import get_s3_client, upload_fileobj_to_s3
 
 logging.basicConfig(
     level=logging.INFO,
@@ -55,6 +58,21 @@ def run_pipeline(
         sys.exit(1)
 
     # -- Step 1: Fetch raw clock events from Google Sheets ---------------------
+    if not skip_upload:
+        # Warm the cached S3 client (service-model parse + TLS setup) in the
+        # background while the Sheets fetch is in flight; the upload step
+        # picks the ready client out of the cache. Errors are left for the
+        # real upload call to surface.
+        threading.Thread(
+            target=get_s3_client,
+            kwargs={
+                "aws_access_key_id": Config.AWS_ACCESS_KEY_ID,
+                "aws_secret_access_key": Config.AWS_SECRET_ACCESS_KEY,
+                "aws_region": Config.AWS_REGION,
+            },
+            daemon=True,
+        ).start()
+
     logger.info("Step 1/4 — Fetching clock events from Google Sheets")
     headers, rows = fetch_sheet_data(
         service_account_file=Config.SERVICE_ACCOUNT_FILE,
@@ -73,30 +91,54 @@ def run_pipeline(
     if end_date is None:
         end_date = report_date
 
-    # -- Step 3: Format as Excel -----------------------------------------------
-    logger.info("Step 3/4 — Formatting Excel spreadsheet")
-    filepath = format_excel(
-        summaries=summaries,
-        report_date=report_date,
-        output_dir=Config.OUTPUT_DIR,
-        filename_prefix=Config.OUTPUT_FILENAME_PREFIX,
-        end_date=end_date,
-    )
-    logger.info("Excel file created: %s", filepath)
-
-    # -- Step 4: Upload to S3 --------------------------------------------------
+    # -- Steps 3 & 4: Format as Excel, then upload -----------------------------
     if skip_upload:
+        logger.info("Step 3/4 — Formatting Excel spreadsheet")
+        # Formatting is CPU-bound (openpyxl holds the GIL); running it in a
+        # worker process keeps the main process free for I/O and lets batch
+        # callers fan out across cores. The summaries are plain dicts of
+        # primitives, so they pickle cheaply. The streaming branch below
+        # stays in-process — its buffer cannot cross a process boundary.
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            filepath = pool.submit(
+                format_excel,
+                summaries=summaries,
+                report_date=report_date,
+                output_dir=Config.OUTPUT_DIR,
+                filename_prefix=Config.OUTPUT_FILENAME_PREFIX,
+                end_date=end_date,
+            ).result()
+        logger.info("Excel file created: %s", filepath)
         logger.info("Step 4/4 — Skipping S3 upload (--skip-upload flag set)")
     else:
-        logger.info("Step 4/4 — Uploading to S3")
-        s3_key = upload_to_s3(
-            filepath=filepath,
-            bucket_name=Config.S3_BUCKET_NAME,
-            s3_prefix=Config.S3_PREFIX,
-            aws_access_key_id=Config.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=Config.AWS_SECRET_ACCESS_KEY,
-            aws_region=Config.AWS_REGION,
-        )
+        # Stream the workbook straight to S3 — no local file write followed
+        # by a re-read for the upload. openpyxl needs a seekable save
+        # target (the zip central directory is written last), so the buffer
+        # is spooled: small reports stay entirely in memory, oversized ones
+        # spill to a temp file instead of ballooning the process.
+        logger.info("Step 3/4 — Formatting Excel spreadsheet (in memory)")
+        with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buffer:
+            filename = format_excel(
+                summaries=summaries,
+                report_date=report_date,
+                output_dir=Config.OUTPUT_DIR,
+                filename_prefix=Config.OUTPUT_FILENAME_PREFIX,
+                end_date=end_date,
+                stream=buffer,
+            )
+            logger.info("Excel workbook built: %s", filename)
+
+            logger.info("Step 4/4 — Uploading to S3")
+            buffer.seek(0)
+            s3_key = upload_fileobj_to_s3(
+                fileobj=buffer,
+                filename=filename,
+                bucket_name=Config.S3_BUCKET_NAME,
+                s3_prefix=Config.S3_PREFIX,
+                aws_access_key_id=Config.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=Config.AWS_SECRET_ACCESS_KEY,
+                aws_region=Config.AWS_REGION,
+            )
         logger.info("Uploaded to s3://%s/%s", Config.S3_BUCKET_NAME, s3_key)
 
     logger.info("Pipeline complete.")
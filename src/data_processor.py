@@ -20,11 +20,16 @@ Processing steps:
     5. Return summary rows ready for the Excel formatter.
 """
 
+import calendar
 import logging
+import re
+import time
 from collections import defaultdict
 from datetime import datetime, date
 from typing import List
 
+import ciso8601
+
 logger = logging.getLogger(__name__)
 
 # Possible formats for the human-readable date column
@@ -36,10 +41,23 @@ DATE_FORMATS = [
     "%Y-%m-%d %H:%M:%S",   # 2026-01-21 10:55:00
 ]
 
+_MONTHS = {name: number for number, name in enumerate(calendar.month_name) if name}
 
-def _parse_datetime(value: str) -> datetime | None:
-    """Try multiple date formats to parse a datetime string."""
-    value = value.strip()
+# One regex covering every known datetime shape: named-month, US slash and
+# ISO dates, each followed by H:M with optional seconds. A single match
+# replaces up to five strptime attempts, each of which raises and catches
+# a ValueError on failure.
+_DT_RE = re.compile(
+    r"^(?:"
+    r"(?P<month_name>[A-Za-z]+)\s+(?P<day_n>\d{1,2})\s+(?P<year_n>\d{4})"    # January 21 2026
+    r"|(?P<month_s>\d{1,2})/(?P<day_s>\d{1,2})/(?P<year_s>\d{4})"            # 01/21/2026
+    r"|(?P<iso>\d{4}-\d{2}-\d{2})"                                           # 2026-01-21
+    r")\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?$"
+)
+
+
+def _parse_datetime_slow(value: str) -> datetime | None:
+    """Fallback: try every known strptime format in turn."""
     for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(value, fmt)
@@ -48,15 +66,79 @@ def _parse_datetime(value: str) -> datetime | None:
     return None
 
 
-def _parse_timestamp(value: str) -> datetime | None:
-    """Parse a unix timestamp string to datetime."""
+def _parse_datetime(value) -> datetime | None:
+    """Parse a datetime string via a single regex match and direct construction.
+
+    Matching `_DT_RE` and building the datetime from its captured groups
+    avoids strptime's per-call format interpretation and the exception
+    churn of trying formats until one fits. ISO strings go through
+    ciso8601's C parser; anything the regex doesn't recognise falls back
+    to the strptime loop.
+    """
+    if not isinstance(value, str):
+        # UNFORMATTED_VALUE can surface non-string cells; those belong to
+        # the timestamp columns, not the human-readable ones.
+        return None
+    value = value.strip()
+    m = _DT_RE.match(value)
+    if m is None:
+        return _parse_datetime_slow(value)
+
+    if m.group("iso") is not None:
+        try:
+            return ciso8601.parse_datetime(value)
+        except ValueError:
+            # ISO-shaped but out of range (e.g. hour 25, month 13)
+            return None
+
+    month_name = m.group("month_name")
+    if month_name is not None:
+        month = _MONTHS.get(month_name)
+        if month is None:
+            return _parse_datetime_slow(value)
+        year, day = int(m.group("year_n")), int(m.group("day_n"))
+    else:
+        year, month, day = int(m.group("year_s")), int(m.group("month_s")), int(m.group("day_s"))
+
     try:
-        ts = int(value.strip())
-        return datetime.fromtimestamp(ts)
-    except (ValueError, TypeError, OSError):
+        return datetime(
+            year, month, day,
+            int(m.group("hour")), int(m.group("minute")), int(m.group("second") or 0),
+        )
+    except ValueError:
+        # Components matched the shape but are out of range (e.g. hour 25)
         return None
 
 
+def _parse_timestamp(value) -> datetime | None:
+    """Parse a unix timestamp (native number or string) to datetime.
+
+    With UNFORMATTED_VALUE the Sheets API returns the epoch columns as
+    numbers, which pass straight through; strings are kept as a fallback
+    for formatted sheets.
+    """
+    if isinstance(value, (int, float)):
+        try:
+            return datetime.fromtimestamp(int(value))
+        except (ValueError, OSError, OverflowError):
+            return None
+    try:
+        return datetime.fromtimestamp(int(value.strip()))
+    except (ValueError, TypeError, AttributeError, OSError):
+        return None
+
+
+def _coerce_epoch(value) -> int | None:
+    """Return the value as integer epoch seconds if it looks like one."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = value.strip()
+        if value.isdigit():
+            return int(value)
+    return None
+
+
 def _find_col(headers: List[str], *candidates: str) -> int | None:
     """Return the index of the first matching header (case-insensitive)."""
     lower = [h.strip().lower() for h in headers]
@@ -98,58 +180,130 @@ def process_clock_events(
     if emp_col is None:
         raise ValueError("Cannot find employee ID column in sheet headers: " + str(headers))
 
-    # -- Parse each row -------------------------------------------------------
-    shifts = []  # list of (employee_id, start_dt, end_dt, hours)
-    skipped_overnight = 0
-    skipped_parse = 0
-
-    for row_idx, row in enumerate(rows):
-        def cell(col_idx):
-            if col_idx is not None and col_idx < len(row):
-                return row[col_idx].strip()
-            return ""
+    # -- Extract the needed columns once (columnar layout) --------------------
+    # Rows from the Sheets API are ragged lists; pulling each column out up
+    # front replaces per-row bounds checks and closure calls with plain
+    # list iteration in the parse loop.
+    def _column(col_idx: int | None) -> List:
+        if col_idx is None:
+            return [""] * len(rows)
+        return [row[col_idx] if col_idx < len(row) else "" for row in rows]
+
+    emp_values = _column(emp_col)
+    start_values = _column(start_col)
+    end_values = _column(end_col)
+    start_ts_values = _column(start_ts_col)
+    end_ts_values = _column(end_ts_col)
 
-        employee_id = cell(emp_col)
+    # -- Parse each row -------------------------------------------------------
+    shifts = []  # list of (employee_id, shift_date, hours)
+
+    # Skipped rows are collected and reported once after the loop — even a
+    # disabled log call costs an argument pack and a logging-module hop per
+    # row, and a warning per bad row can flood the output.
+    unparseable_rows: list[int] = []
+    overnight_rows: list[int] = []
+    nonpositive_rows: list[int] = []
+
+    # When both timestamp columns are present the overnight filter runs on
+    # time.localtime's C-level struct (year, month, day) slices and the
+    # duration on plain integer seconds — no datetime objects needed. The
+    # local day must come from localtime per timestamp, not a fixed UTC
+    # offset: a single offset taken from "now" is an hour off for rows in
+    # the opposite DST phase, which would misbucket same-day shifts as
+    # overnight. Calendar dates are materialised once per unique day via a
+    # small cache.
+    day_dates: dict[tuple[int, int, int], date] = {}
+
+    # Bind the per-row callables to locals: LOAD_FAST inside the loop
+    # instead of a module-global or attribute lookup per call.
+    coerce_epoch = _coerce_epoch
+    localtime = time.localtime
+    parse_datetime = _parse_datetime
+    parse_timestamp = _parse_timestamp
+    day_dates_get = day_dates.get
+    shifts_append = shifts.append
+
+    row_columns = zip(emp_values, start_values, end_values, start_ts_values, end_ts_values)
+    for row_idx, (emp_raw, start_raw, end_raw, start_ts_raw, end_ts_raw) in enumerate(row_columns):
+        # Employee IDs arrive as numbers under UNFORMATTED_VALUE
+        employee_id = emp_raw.strip() if isinstance(emp_raw, str) else str(emp_raw)
         if not employee_id:
             continue
 
-        # Parse start datetime (try human-readable first, then timestamp)
-        start_dt = _parse_datetime(cell(start_col)) if start_col is not None else None
-        if start_dt is None and start_ts_col is not None:
-            start_dt = _parse_timestamp(cell(start_ts_col))
-
-        # Parse end datetime
-        end_dt = _parse_datetime(cell(end_col)) if end_col is not None else None
-        if end_dt is None and end_ts_col is not None:
-            end_dt = _parse_timestamp(cell(end_ts_col))
+        # Fast path: both epoch columns present
+        start_ts = coerce_epoch(start_ts_raw)
+        end_ts = coerce_epoch(end_ts_raw)
+        if start_ts is not None and end_ts is not None:
+            try:
+                start_day = localtime(start_ts)[:3]
+                end_day = localtime(end_ts)[:3]
+            except (ValueError, OSError, OverflowError):
+                # Corrupt epoch cell beyond localtime's range — fall
+                # through to the human-readable columns below, same as
+                # _parse_timestamp treats it.
+                pass
+            else:
+                if start_day != end_day:
+                    overnight_rows.append(row_idx + 2)
+                    continue
+
+                duration_seconds = end_ts - start_ts
+                if duration_seconds <= 0:
+                    nonpositive_rows.append(row_idx + 2)
+                    continue
+
+                shift_date = day_dates_get(start_day)
+                if shift_date is None:
+                    shift_date = date(*start_day)
+                    day_dates[start_day] = shift_date
+
+                shifts_append((employee_id, shift_date, round(duration_seconds / 3600, 2)))
+                continue
+
+        # Slow path: parse the human-readable columns (timestamp fallback)
+        start_dt = parse_datetime(start_raw) if start_raw else None
+        if start_dt is None and start_ts_raw:
+            start_dt = parse_timestamp(start_ts_raw)
+
+        end_dt = parse_datetime(end_raw) if end_raw else None
+        if end_dt is None and end_ts_raw:
+            end_dt = parse_timestamp(end_ts_raw)
 
         if start_dt is None or end_dt is None:
-            skipped_parse += 1
-            logger.warning("Row %d: could not parse start/end times, skipping", row_idx + 2)
+            unparseable_rows.append(row_idx + 2)
             continue
 
         # Filter out overnight shifts (start and end on different dates)
         if start_dt.date() != end_dt.date():
-            skipped_overnight += 1
-            logger.debug(
-                "Row %d: overnight shift (%s -> %s), skipping",
-                row_idx + 2, start_dt.date(), end_dt.date(),
-            )
+            overnight_rows.append(row_idx + 2)
             continue
 
         # Calculate hours
         duration_seconds = (end_dt - start_dt).total_seconds()
         if duration_seconds <= 0:
-            logger.warning("Row %d: non-positive duration, skipping", row_idx + 2)
+            nonpositive_rows.append(row_idx + 2)
             continue
 
         hours = round(duration_seconds / 3600, 2)
-        shifts.append((employee_id, start_dt.date(), hours))
+        shifts_append((employee_id, start_dt.date(), hours))
 
     logger.info(
         "Parsed %d valid shifts (%d overnight skipped, %d unparseable)",
-        len(shifts), skipped_overnight, skipped_parse,
+        len(shifts), len(overnight_rows), len(unparseable_rows),
     )
+    if unparseable_rows:
+        logger.warning(
+            "Skipped %d rows with unparseable start/end times: %s",
+            len(unparseable_rows), unparseable_rows,
+        )
+    if nonpositive_rows:
+        logger.warning(
+            "Skipped %d rows with non-positive duration: %s",
+            len(nonpositive_rows), nonpositive_rows,
+        )
+    if overnight_rows and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Skipped overnight-shift rows: %s", overnight_rows)
 
     if not shifts:
         raise ValueError("No valid shifts found in the data")
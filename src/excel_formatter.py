@@ -7,15 +7,27 @@ Produces a .xlsx file matching the exact HR hours summary format:
   - Two sheet tabs: "Hours Summary Report" and the start date (MM.DD.YYYY)
 """
 
+import io
 import logging
 import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date, datetime
-from typing import List
+from typing import IO, List
 
 from openpyxl import Workbook
-from openpyxl.styles import Alignment, Font
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle
 from openpyxl.utils import get_column_letter
 
+try:
+    # openpyxl uses lxml's C-accelerated serializer automatically when present
+    from openpyxl import LXML as _HAVE_LXML
+except ImportError:
+    _HAVE_LXML = False
+
 logger = logging.getLogger(__name__)
 
 # Column order in the output spreadsheet
@@ -32,41 +44,189 @@ OUTPUT_COLUMNS = [
 
 NUMERIC_FIELDS = {"regular_hours", "ot1_hours", "paid_hours", "unpaid_hours"}
 
+# Re-deflating the saved workbook at maximum compression only pays off once
+# there is enough repetitive sheet XML to shrink; small daily reports skip it.
+RECOMPRESS_MIN_ROWS = 10_000
+
+# xlsx worksheets hold at most 1,048,576 rows; two are used by the date and
+# header rows. Inputs past this are split across numbered sheets.
+MAX_DATA_ROWS_PER_SHEET = 1_048_574
+
+# Flattened views of OUTPUT_COLUMNS so the per-row loops iterate plain
+# tuples instead of unpacking (header, key) pairs and re-testing
+# NUMERIC_FIELDS membership for every cell.
+FIELD_KEYS = tuple(field_key for _, field_key in OUTPUT_COLUMNS)
+FIELD_STYLES = tuple(
+    "hr_numeric" if field_key in NUMERIC_FIELDS else "hr_text" for field_key in FIELD_KEYS
+)
+
 HEADER_FONT = Font(name="Calibri", size=11, bold=True)
 DATA_FONT = Font(name="Calibri", size=11)
 DATE_FONT = Font(name="Calibri", size=11, bold=True)
+NUMERIC_ALIGNMENT = Alignment(horizontal="right")
 
+# Named styles registered once per workbook: assigning `cell.style = "name"`
+# is a single lookup into the workbook's style table instead of three
+# per-cell attribute assignments that each re-index into openpyxl's
+# style registry.
+_NAMED_STYLES = (
+    NamedStyle(name="hr_date", font=DATE_FONT),
+    NamedStyle(name="hr_header", font=HEADER_FONT),
+    NamedStyle(name="hr_text", font=DATA_FONT),
+    NamedStyle(
+        name="hr_numeric",
+        font=DATA_FONT,
+        number_format="0.00",
+        alignment=NUMERIC_ALIGNMENT,
+    ),
+)
 
-def _write_sheet(ws, start_date_str: str, end_date_str: str, summaries: List[dict]) -> None:
-    """Write the standard hours summary layout to a worksheet."""
 
+def _register_styles(wb: Workbook) -> None:
+    """Register the shared named styles on a freshly created workbook."""
+    for style in _NAMED_STYLES:
+        wb.add_named_style(style)
+
+
+def _make_row_builder():
+    """Generate an unrolled data-row builder specialised to OUTPUT_COLUMNS.
+
+    The output schema is fixed at import time, so the per-cell loop and
+    style dispatch can be partially evaluated into straight-line code: one
+    WriteOnlyCell construction and one constant style assignment per
+    column, with no loop or key iteration at call time.
+    """
+    lines = ["def _build_row_cells(ws, summary):"]
+    names = []
+    for i, (field_key, style) in enumerate(zip(FIELD_KEYS, FIELD_STYLES)):
+        name = f"c{i}"
+        lines.append(f'    {name} = WriteOnlyCell(ws, value=summary.get({field_key!r}, ""))')
+        lines.append(f"    {name}.style = {style!r}")
+        names.append(name)
+    lines.append("    return [" + ", ".join(names) + "]")
+
+    namespace = {"WriteOnlyCell": WriteOnlyCell}
+    exec("\n".join(lines), namespace)
+    return namespace["_build_row_cells"]
+
+
+_build_row_cells = _make_row_builder()
+
+
+def _compute_col_widths(summaries: List[dict]) -> List[int]:
+    """Compute per-column max display widths.
+
+    Numeric columns render through the 0.00 number format, so their width
+    is bounded by the widest formatted maximum — one max() per column with
+    no per-row str() conversions. Only the text columns need a
+    value-length scan.
+    """
+    widths = [len(header_name) for header_name, _ in OUTPUT_COLUMNS]
+    if not summaries:
+        return widths
+
+    for i, field_key in enumerate(FIELD_KEYS):
+        if field_key in NUMERIC_FIELDS:
+            max_value = max(summary.get(field_key, 0.0) for summary in summaries)
+            value_len = len(f"{max_value:.2f}")
+            if value_len > widths[i]:
+                widths[i] = value_len
+        else:
+            for summary in summaries:
+                value = summary.get(field_key, "")
+                # Exact type check: the common case is already a str, and
+                # type(...) is faster than isinstance in the hot loop
+                value_len = len(value if type(value) is str else str(value))
+                if value_len > widths[i]:
+                    widths[i] = value_len
+    return widths
+
+
+def _build_rows(
+    ws,
+    start_date_str: str,
+    end_date_str: str,
+    summaries: List[dict],
+) -> List[List[WriteOnlyCell]]:
+    """Build the full pre-styled row buffer for the hours summary layout.
+
+    The cells only reference shared named styles, so the same buffer can be
+    appended to every sheet in the workbook — both tabs are rendered from
+    one pass over the data.
+    """
     # Row 1: Date range
-    ws.cell(row=1, column=1, value=start_date_str).font = DATE_FONT
-    ws.cell(row=1, column=2, value=end_date_str).font = DATE_FONT
+    start_cell = WriteOnlyCell(ws, value=start_date_str)
+    start_cell.style = "hr_date"
+    end_cell = WriteOnlyCell(ws, value=end_date_str)
+    end_cell.style = "hr_date"
+    rows = [[start_cell, end_cell]]
 
     # Row 2: Headers
-    for col_idx, (header_name, _) in enumerate(OUTPUT_COLUMNS, start=1):
-        cell = ws.cell(row=2, column=col_idx, value=header_name)
-        cell.font = HEADER_FONT
-
-    # Row 3+: Data
-    data_start_row = 3
-    for row_offset, summary in enumerate(summaries):
-        row_idx = data_start_row + row_offset
-        for col_idx, (_, field_key) in enumerate(OUTPUT_COLUMNS, start=1):
-            value = summary.get(field_key, "")
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.font = DATA_FONT
-            if field_key in NUMERIC_FIELDS:
-                cell.number_format = "0.00"
-                cell.alignment = Alignment(horizontal="right")
-
-    # Auto-fit column widths
-    for col_idx, (header_name, field_key) in enumerate(OUTPUT_COLUMNS, start=1):
-        max_len = len(header_name)
-        for summary in summaries:
-            max_len = max(max_len, len(str(summary.get(field_key, ""))))
-        ws.column_dimensions[get_column_letter(col_idx)].width = max_len + 3
+    header_cells = []
+    for header_name, _ in OUTPUT_COLUMNS:
+        cell = WriteOnlyCell(ws, value=header_name)
+        cell.style = "hr_header"
+        header_cells.append(cell)
+    rows.append(header_cells)
+
+    # Row 3+: Data (via the unrolled builder generated at import)
+    for summary in summaries:
+        rows.append(_build_row_cells(ws, summary))
+
+    return rows
+
+
+def _fast_tmp_dir() -> str:
+    """Pick a scratch directory for workbook saves, RAM-backed when available.
+
+    /dev/shm is tmpfs on Linux, so the (possibly recompressed) workbook is
+    assembled entirely in memory and only touches real disk on the final
+    move into output_dir.
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm):
+        return shm
+    return tempfile.gettempdir()
+
+
+def _recompress_xlsx(target) -> None:
+    """Rewrite a saved xlsx with every zip entry deflated at level 9.
+
+    openpyxl saves at zlib's default level; for sheets with very many
+    repetitive row elements the stronger deflate shrinks the file enough
+    to pay back in upload time. `target` is a file path or a seekable
+    binary stream, rewritten in place.
+    """
+    if not isinstance(target, str):
+        target.seek(0)
+    with zipfile.ZipFile(target, "r") as zin:
+        entries = [(item.filename, zin.read(item.filename)) for item in zin.infolist()]
+
+    rewritten = io.BytesIO()
+    with zipfile.ZipFile(rewritten, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as zout:
+        for name, data in entries:
+            zout.writestr(name, data)
+
+    if isinstance(target, str):
+        with open(target, "wb") as fh:
+            fh.write(rewritten.getvalue())
+    else:
+        target.seek(0)
+        target.truncate()
+        target.write(rewritten.getvalue())
+
+
+def _write_sheet(ws, rows: List[List[WriteOnlyCell]], col_widths: List[int]) -> None:
+    """Set column widths and append the shared row buffer to a worksheet.
+
+    Write-only worksheets stream rows out as they are appended, so widths
+    must be applied before the first append.
+    """
+    for col_idx, width in enumerate(col_widths, start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 3, 50)
+
+    for row in rows:
+        ws.append(row)
 
 
 def format_excel(
@@ -75,18 +235,29 @@ def format_excel(
     output_dir: str,
     filename_prefix: str,
     end_date: date | None = None,
+    stream: IO[bytes] | None = None,
+    rows_per_sheet: int | None = None,
 ) -> str:
     """Create the hours summary Excel workbook matching the required format.
 
     Args:
         summaries: List of employee summary dicts from data_processor.
         report_date: The report / pay-period start date.
-        output_dir: Directory to write the output file.
+        output_dir: Directory to write the output file. Ignored when
+                    `stream` is given.
         filename_prefix: Prefix for the output filename.
         end_date: Pay period end date. Defaults to report_date.
+        stream: Optional writable binary buffer. When given, the workbook is
+                saved into it instead of touching the filesystem (e.g. for
+                direct S3 upload).
+        rows_per_sheet: Maximum data rows per sheet; inputs past it are
+                        split across numbered tabs ("... (2)", ...).
+                        Defaults to the xlsx row limit, so normal reports
+                        keep their single pair of tabs.
 
     Returns:
-        The full path to the generated .xlsx file.
+        The full path to the generated .xlsx file, or just the generated
+        filename when saving to `stream`.
     """
     if end_date is None:
         end_date = report_date
@@ -97,20 +268,98 @@ def format_excel(
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{filename_prefix}_{timestamp}.xlsx"
-    filepath = os.path.join(output_dir, filename)
-    os.makedirs(output_dir, exist_ok=True)
 
-    wb = Workbook()
+    if not _HAVE_LXML:
+        logger.debug("lxml not installed; openpyxl will use the slower pure-Python serializer")
+
+    wb = Workbook(write_only=True)
+    _register_styles(wb)
+    col_widths = _compute_col_widths(summaries)
+
+    if rows_per_sheet is None:
+        rows_per_sheet = MAX_DATA_ROWS_PER_SHEET
+    chunks = [
+        summaries[i:i + rows_per_sheet]
+        for i in range(0, len(summaries), rows_per_sheet)
+    ] or [summaries]
+
+    # The summary tab and the date tab carry identical content, so render
+    # each chunk's rows once and append the same buffer to both. Normal
+    # reports fit one chunk and keep the usual two tabs; oversized inputs
+    # continue into "... (2)", "... (3)" pairs.
+    chunk_rows = []
+    for chunk_idx, chunk in enumerate(chunks):
+        suffix = "" if chunk_idx == 0 else f" ({chunk_idx + 1})"
+        ws = wb.create_sheet(title=f"Hours Summary Report{suffix}")
+        rows = _build_rows(ws, start_date_str, end_date_str, chunk)
+        chunk_rows.append(rows)
+        _write_sheet(ws, rows, col_widths)
 
-    # Sheet 1: "Hours Summary Report"
-    ws1 = wb.active
-    ws1.title = "Hours Summary Report"
-    _write_sheet(ws1, start_date_str, end_date_str, summaries)
+    for chunk_idx, rows in enumerate(chunk_rows):
+        suffix = "" if chunk_idx == 0 else f" ({chunk_idx + 1})"
+        ws = wb.create_sheet(title=f"{tab_date_label}{suffix}")
+        _write_sheet(ws, rows, col_widths)
 
-    # Sheet 2: date tab (MM.DD.YYYY)
-    ws2 = wb.create_sheet(title=tab_date_label)
-    _write_sheet(ws2, start_date_str, end_date_str, summaries)
+    recompress = len(summaries) >= RECOMPRESS_MIN_ROWS
+
+    if stream is not None:
+        wb.save(stream)
+        if recompress:
+            _recompress_xlsx(stream)
+        logger.info("Excel workbook %s written to in-memory stream", filename)
+        return filename
+
+    filepath = os.path.join(output_dir, filename)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Save to a temp file on a RAM-backed filesystem, then move into place:
+    # the serialization churn never hits the output disk, and readers of
+    # output_dir only ever see a complete workbook.
+    tmp = tempfile.NamedTemporaryFile("wb", dir=_fast_tmp_dir(), suffix=".xlsx", delete=False)
+    try:
+        with tmp:
+            wb.save(tmp)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        if recompress:
+            _recompress_xlsx(tmp.name)
+        try:
+            os.replace(tmp.name, filepath)
+        except OSError:
+            # output_dir on a different filesystem than the scratch dir —
+            # os.replace cannot cross devices, so fall back to a copy+unlink.
+            shutil.move(tmp.name, filepath)
+    finally:
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
 
-    wb.save(filepath)
     logger.info("Excel file written to %s", filepath)
     return filepath
+
+
+def format_excel_batch(reports: List[dict], max_workers: int | None = None) -> List[str]:
+    """Format several reports concurrently across worker processes.
+
+    Workbook serialization is pure-Python CPU work that holds the GIL, so
+    multi-report runs scale with processes rather than threads. Each entry
+    in `reports` is a dict of keyword arguments for format_excel (minus
+    `stream`, which cannot cross a process boundary).
+
+    Args:
+        reports: List of format_excel keyword-argument dicts.
+        max_workers: Worker process count. Defaults to the CPU count.
+
+    Returns:
+        The generated file paths, in completion order.
+    """
+    if not reports:
+        return []
+
+    filepaths = []
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        futures = [pool.submit(format_excel, **report) for report in reports]
+        for future in as_completed(futures):
+            filepath = future.result()
+            logger.info("Batch report ready: %s", filepath)
+            filepaths.append(filepath)
+    return filepaths